@@ -1,7 +1,60 @@
 import sqlite3
 import os
+import json
+import atexit
+import threading
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 
+# SQL used by the DAL. Keeping each statement as a single constant means the
+# exact same text is always passed to sqlite3, so its statement cache hits and
+# the query is not re-parsed on every call.
+# Rows are selected in COLUMNS order and unpacked positionally by _row_to_dict.
+COLUMNS = 'id, title, description, image_path, project_type, year, status, tech_stack, github_url, live_url, featured, created_at, updated_at'
+SQL_GET_ALL = 'SELECT ' + COLUMNS + ' FROM projects ORDER BY featured DESC, year DESC'
+SQL_GET_BY_ID = 'SELECT ' + COLUMNS + ' FROM projects WHERE id = ?'
+SQL_GET_FEATURED = 'SELECT ' + COLUMNS + ' FROM projects WHERE featured = 1 ORDER BY year DESC'
+SQL_COUNT = 'SELECT COUNT(*) FROM projects'
+SQL_GET_VERSION = 'SELECT version FROM projects_version'
+# Renders the same list as SQL_GET_ALL + _rows_to_dicts straight to a JSON
+# array inside SQLite, so no per-row Python objects are built
+SQL_GET_ALL_JSON = '''
+    SELECT json_group_array(json_object(
+        'id', id, 'title', title, 'description', description, 'image_path', image_path,
+        'project_type', project_type, 'year', year, 'status', status,
+        'tech_stack', json(tech_stack), 'github_url', github_url, 'live_url', live_url,
+        'featured', CASE WHEN featured THEN json('true') ELSE json('false') END,
+        'created_at', created_at, 'updated_at', updated_at
+    ))
+    FROM (SELECT * FROM projects ORDER BY featured DESC, year DESC)
+'''
+SQL_SEARCH = (
+    'SELECT ' + COLUMNS + ' FROM projects'
+    ' WHERE id IN (SELECT rowid FROM projects_fts WHERE projects_fts MATCH ?)'
+    ' ORDER BY featured DESC, year DESC'
+)
+SQL_INSERT = '''
+    INSERT INTO projects (title, description, image_path, project_type, year, status, tech_stack, github_url, live_url, featured)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+SQL_DELETE = 'DELETE FROM projects WHERE id = ?'
+
+# Fields create_project requires; the rest are optional
+REQUIRED_FIELDS = ('title', 'description', 'image_path', 'project_type', 'year', 'status', 'tech_stack')
+
+# Columns a partial update may touch. SQL_UPDATE is one fixed statement for
+# every combination of fields: each column takes a "field was provided" flag
+# followed by its new value, so NULL can still be written explicitly.
+UPDATABLE_FIELDS = ('title', 'description', 'image_path', 'project_type', 'year', 'status', 'tech_stack', 'github_url', 'live_url', 'featured')
+SQL_UPDATE = (
+    'UPDATE projects SET '
+    + ', '.join(f'{field} = CASE WHEN ? THEN ? ELSE {field} END' for field in UPDATABLE_FIELDS)
+    + ', updated_at = CURRENT_TIMESTAMP WHERE id = ?'
+)
+
+# Size of each connection's prepared statement cache
+STATEMENT_CACHE_SIZE = 256
+
 class DatabaseAccessLayer:
     """Data Access Layer for managing projects database operations."""
     
@@ -12,16 +65,66 @@ class DatabaseAccessLayer:
             self.db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'projects.db')
         else:
             self.db_path = db_path
+        
+        # Each thread keeps its own long-lived connection (and with it a warm
+        # page cache). Every open connection is also tracked by owning thread
+        # so that ones left by finished threads, and all remaining ones at
+        # interpreter exit, can be closed.
+        self._tls = threading.local()
+        self._connections = {}
+        self._connections_lock = threading.Lock()
+        atexit.register(self.close_all)
     
     def get_connection(self):
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's database connection, opening it on first use."""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            # check_same_thread=False only so close_all can close connections
+            # from another thread; each connection is still used by one thread
+            conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+            self._configure_connection(conn)
+            self._tls.conn = conn
+            with self._connections_lock:
+                for thread in [t for t in self._connections if not t.is_alive()]:
+                    self._connections.pop(thread).close()
+                self._connections[threading.current_thread()] = conn
         return conn
     
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply write-friendly PRAGMAs to a freshly opened connection."""
+        # WAL mode is persistent in the database file, so only switch once
+        if conn.execute('PRAGMA journal_mode').fetchone()[0] != 'wal':
+            conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA mmap_size=268435456')
+    
+    def close(self):
+        """Close this thread's database connection, if one is open."""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is not None:
+            with self._connections_lock:
+                self._connections.pop(threading.current_thread(), None)
+            conn.close()
+            self._tls.conn = None
+    
+    def close_all(self):
+        """Close every connection opened by any thread.
+        
+        Registered to run at interpreter exit. Other threads must not use the
+        DAL afterwards; the calling thread reopens a connection on next use.
+        """
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+        self._tls.conn = None
+    
     def init_database(self):
         """Initialize the database with projects table and sample data."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
         
         # Create projects table
@@ -43,8 +146,77 @@ class DatabaseAccessLayer:
             )
         ''')
         
+        # Index the default listing order and keep a full-text index of the
+        # searchable columns in sync through triggers
+        fts_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects_fts'"
+        ).fetchone() is not None
+        cursor.executescript('''
+            CREATE INDEX IF NOT EXISTS idx_projects_feat_year ON projects(featured DESC, year DESC);
+            
+            CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+                title, description, tech_stack, content='projects', content_rowid='id'
+            );
+            
+            CREATE TRIGGER IF NOT EXISTS projects_ai AFTER INSERT ON projects BEGIN
+                INSERT INTO projects_fts(rowid, title, description, tech_stack)
+                VALUES (new.id, new.title, new.description, new.tech_stack);
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS projects_ad AFTER DELETE ON projects BEGIN
+                INSERT INTO projects_fts(projects_fts, rowid, title, description, tech_stack)
+                VALUES ('delete', old.id, old.title, old.description, old.tech_stack);
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS projects_au AFTER UPDATE ON projects BEGIN
+                INSERT INTO projects_fts(projects_fts, rowid, title, description, tech_stack)
+                VALUES ('delete', old.id, old.title, old.description, old.tech_stack);
+                INSERT INTO projects_fts(rowid, title, description, tech_stack)
+                VALUES (new.id, new.title, new.description, new.tech_stack);
+            END;
+        ''')
+        
+        # projects_version is bumped by triggers on every write to projects.
+        # Cached reads are keyed on it, so a write from any thread or worker
+        # process makes older entries unreachable instead of clearing them.
+        cursor.executescript('''
+            CREATE TABLE IF NOT EXISTS projects_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO projects_version (id, version) VALUES (1, 0);
+            
+            CREATE TRIGGER IF NOT EXISTS projects_version_ai AFTER INSERT ON projects BEGIN
+                UPDATE projects_version SET version = version + 1;
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS projects_version_ad AFTER DELETE ON projects BEGIN
+                UPDATE projects_version SET version = version + 1;
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS projects_version_au AFTER UPDATE ON projects BEGIN
+                UPDATE projects_version SET version = version + 1;
+            END;
+        ''')
+        if not fts_exists:
+            # Index rows that were added before the full-text table existed
+            with conn:
+                cursor.execute("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')")
+        
+        # tech_stack used to be stored comma-joined; convert any such rows to JSON arrays
+        legacy = cursor.execute('''
+            SELECT id, tech_stack FROM projects
+            WHERE CASE WHEN json_valid(tech_stack) THEN json_type(tech_stack) END IS NOT 'array'
+        ''').fetchall()
+        if legacy:
+            with conn:
+                cursor.executemany(
+                    'UPDATE projects SET tech_stack = ? WHERE id = ?',
+                    [(self._encode_tech_stack(tech_stack), project_id) for project_id, tech_stack in legacy]
+                )
+        
         # Insert sample projects if table is empty
-        cursor.execute('SELECT COUNT(*) FROM projects')
+        cursor.execute(SQL_COUNT)
         if cursor.fetchone()[0] == 0:
             sample_projects = [
                 {
@@ -54,7 +226,7 @@ class DatabaseAccessLayer:
                     'project_type': 'Full-Stack Application',
                     'year': 2024,
                     'status': 'Completed',
-                    'tech_stack': 'Flask,SQLite,JavaScript,CSS3,HTML5',
+                    'tech_stack': ['Flask', 'SQLite', 'JavaScript', 'CSS3', 'HTML5'],
                     'github_url': 'https://github.com/Laufterbeast/FinalLauf.git',
                     'live_url': None,
                     'featured': 1
@@ -66,7 +238,7 @@ class DatabaseAccessLayer:
                     'project_type': 'Portfolio Website',
                     'year': 2023,
                     'status': 'Completed',
-                    'tech_stack': 'HTML5,CSS3,JavaScript',
+                    'tech_stack': ['HTML5', 'CSS3', 'JavaScript'],
                     'github_url': 'https://github.com/Laufterbeast/Personalwebv2.git',
                     'live_url': None,
                     'featured': 0
@@ -78,175 +250,204 @@ class DatabaseAccessLayer:
                     'project_type': 'Portfolio Website',
                     'year': 2023,
                     'status': 'Refactored',
-                    'tech_stack': 'HTML5,CSS3,Accessibility',
+                    'tech_stack': ['HTML5', 'CSS3', 'Accessibility'],
                     'github_url': None,
                     'live_url': None,
                     'featured': 0
                 }
             ]
             
-            for project in sample_projects:
-                cursor.execute('''
-                    INSERT INTO projects (title, description, image_path, project_type, year, status, tech_stack, github_url, live_url, featured)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            # Seed all rows in one explicit transaction (a single commit/fsync)
+            rows = [
+                (
                     project['title'], project['description'], project['image_path'],
                     project['project_type'], project['year'], project['status'],
-                    project['tech_stack'], project['github_url'], project['live_url'],
+                    json.dumps(project['tech_stack']), project['github_url'], project['live_url'],
                     project['featured']
-                ))
-        
-        conn.commit()
-        conn.close()
+                )
+                for project in sample_projects
+            ]
+            with conn:
+                cursor.execute('BEGIN')
+                cursor.executemany(SQL_INSERT, rows)
     
     def get_all_projects(self) -> List[Dict[str, Any]]:
-        """Get all projects ordered by featured status and year."""
-        conn = self.get_connection()
-        try:
-            projects = conn.execute('SELECT * FROM projects ORDER BY featured DESC, year DESC').fetchall()
-            return [self._row_to_dict(project) for project in projects]
-        finally:
-            conn.close()
+        """Get all projects ordered by featured status and year.
+        
+        The result is cached until the next write and shared between callers,
+        so it must not be modified.
+        """
+        return self._get_all_projects(self._current_version())
+    
+    def get_all_projects_json(self) -> str:
+        """Get all projects as a JSON array, cached until the next write."""
+        return self._get_all_projects_json(self._current_version())
     
     def get_project_by_id(self, project_id: int) -> Optional[Dict[str, Any]]:
-        """Get a specific project by ID."""
+        """Get a specific project by ID (cached and shared, like get_all_projects)."""
+        return self._get_project_by_id(self._current_version(), project_id)
+    
+    @lru_cache(maxsize=8)
+    def _get_all_projects(self, version: int) -> List[Dict[str, Any]]:
+        """Query all projects for the given cache version."""
         conn = self.get_connection()
-        try:
-            project = conn.execute('SELECT * FROM projects WHERE id = ?', (project_id,)).fetchone()
-            return self._row_to_dict(project) if project else None
-        finally:
-            conn.close()
+        projects = conn.execute(SQL_GET_ALL).fetchall()
+        return self._rows_to_dicts(projects)
+    
+    @lru_cache(maxsize=8)
+    def _get_all_projects_json(self, version: int) -> str:
+        """Render all projects to JSON in SQLite for the given cache version."""
+        conn = self.get_connection()
+        return conn.execute(SQL_GET_ALL_JSON).fetchone()[0]
+    
+    @lru_cache(maxsize=512)
+    def _get_project_by_id(self, version: int, project_id: int) -> Optional[Dict[str, Any]]:
+        """Query one project for the given cache version."""
+        conn = self.get_connection()
+        project = conn.execute(SQL_GET_BY_ID, (project_id,)).fetchone()
+        return self._row_to_dict(project) if project else None
+    
+    def _current_version(self) -> int:
+        """Get the write version that cached reads are keyed on."""
+        conn = self.get_connection()
+        return conn.execute(SQL_GET_VERSION).fetchone()[0]
     
     def create_project(self, project_data: Dict[str, Any]) -> int:
-        """Create a new project and return the project ID."""
+        """Create a new project and return the project ID.
+        
+        Raises ValueError if a required field is missing.
+        """
+        for field in REQUIRED_FIELDS:
+            if field not in project_data:
+                raise ValueError(f'Missing required field: {field}')
+        
         conn = self.get_connection()
         cursor = conn.cursor()
-        try:
-            tech_stack_str = ','.join(project_data['tech_stack']) if isinstance(project_data['tech_stack'], list) else project_data['tech_stack']
-            
-            cursor.execute('''
-                INSERT INTO projects (title, description, image_path, project_type, year, status, tech_stack, github_url, live_url, featured)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+        with conn:
+            cursor.execute(SQL_INSERT, (
                 project_data['title'], project_data['description'], project_data['image_path'],
                 project_data['project_type'], project_data['year'], project_data['status'],
-                tech_stack_str, project_data.get('github_url'), project_data.get('live_url'),
-                project_data.get('featured', False)
+                self._encode_tech_stack(project_data['tech_stack']), project_data.get('github_url'), project_data.get('live_url'),
+                bool(project_data.get('featured', False))
             ))
             
             project_id = cursor.lastrowid
-            conn.commit()
             return project_id
-        finally:
-            conn.close()
     
     def update_project(self, project_id: int, project_data: Dict[str, Any]) -> bool:
         """Update an existing project. Returns True if successful."""
+        params = []
+        for field in UPDATABLE_FIELDS:
+            value = project_data.get(field)
+            if field == 'tech_stack' and field in project_data:
+                value = self._encode_tech_stack(value)
+            elif field == 'featured':
+                # Store 0/1 so the SQL and Python readers agree on truthiness
+                value = bool(value)
+            params.extend((field in project_data, value))
+        
+        # Nothing to update: skip SQLite entirely
+        if not any(params[::2]):
+            return False
+        params.append(project_id)
+        
         conn = self.get_connection()
         cursor = conn.cursor()
-        try:
-            # Check if project exists
-            project = cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,)).fetchone()
-            if project is None:
-                return False
-            
-            # Build update query dynamically
-            update_fields = []
-            update_values = []
-            
-            for field in ['title', 'description', 'image_path', 'project_type', 'year', 'status', 'tech_stack', 'github_url', 'live_url', 'featured']:
-                if field in project_data:
-                    if field == 'tech_stack' and isinstance(project_data[field], list):
-                        update_fields.append(f"{field} = ?")
-                        update_values.append(','.join(project_data[field]))
-                    else:
-                        update_fields.append(f"{field} = ?")
-                        update_values.append(project_data[field])
-            
-            if update_fields:
-                update_fields.append("updated_at = CURRENT_TIMESTAMP")
-                update_values.append(project_id)
-                
-                cursor.execute(f'''
-                    UPDATE projects SET {', '.join(update_fields)}
-                    WHERE id = ?
-                ''', update_values)
-                
-                conn.commit()
-                return True
-            
-            return False
-        finally:
-            conn.close()
+        with conn:
+            cursor.execute(SQL_UPDATE, params)
+            return cursor.rowcount > 0
     
     def delete_project(self, project_id: int) -> bool:
         """Delete a project by ID. Returns True if successful."""
         conn = self.get_connection()
         cursor = conn.cursor()
-        try:
-            # Check if project exists
-            project = cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,)).fetchone()
-            if project is None:
-                return False
-            
-            cursor.execute('DELETE FROM projects WHERE id = ?', (project_id,))
-            conn.commit()
-            return True
-        finally:
-            conn.close()
+        with conn:
+            cursor.execute(SQL_DELETE, (project_id,))
+            return cursor.rowcount > 0
     
-    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
-        """Convert SQLite row to dictionary with proper data types."""
+    def _encode_tech_stack(self, tech_stack: Any) -> Optional[str]:
+        """Encode a tech stack as a JSON array.
+        
+        Accepts a list, a comma-separated string or a single other value,
+        which becomes a one-item list. None is passed through so the NOT NULL
+        constraint still rejects it.
+        """
+        if tech_stack is None:
+            return None
+        if isinstance(tech_stack, str):
+            tech_stack = [tech.strip() for tech in tech_stack.split(',') if tech.strip()]
+        elif isinstance(tech_stack, (list, tuple)):
+            tech_stack = list(tech_stack)
+        else:
+            tech_stack = [str(tech_stack)]
+        return json.dumps(tech_stack)
+    
+    def _row_to_dict(self, row: tuple) -> Dict[str, Any]:
+        """Convert a row selected in COLUMNS order to a dictionary with proper data types."""
         if row is None:
             return None
         
-        return {
-            'id': row['id'],
-            'title': row['title'],
-            'description': row['description'],
-            'image_path': row['image_path'],
-            'project_type': row['project_type'],
-            'year': row['year'],
-            'status': row['status'],
-            'tech_stack': row['tech_stack'].split(',') if row['tech_stack'] else [],
-            'github_url': row['github_url'],
-            'live_url': row['live_url'],
-            'featured': bool(row['featured']),
-            'created_at': row['created_at'],
-            'updated_at': row['updated_at']
-        }
+        return self._rows_to_dicts((row,))[0]
+    
+    def _rows_to_dicts(self, rows) -> List[Dict[str, Any]]:
+        """Convert rows selected in COLUMNS order to dictionaries in a single pass."""
+        return [
+            {
+                'id': project_id,
+                'title': title,
+                'description': description,
+                'image_path': image_path,
+                'project_type': project_type,
+                'year': year,
+                'status': status,
+                'tech_stack': json.loads(tech_stack) if tech_stack else [],
+                'github_url': github_url,
+                'live_url': live_url,
+                'featured': bool(featured),
+                'created_at': created_at,
+                'updated_at': updated_at
+            }
+            for (project_id, title, description, image_path, project_type, year, status,
+                 tech_stack, github_url, live_url, featured, created_at, updated_at) in rows
+        ]
     
     def get_projects_count(self) -> int:
         """Get total number of projects."""
         conn = self.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM projects')
-            return cursor.fetchone()[0]
-        finally:
-            conn.close()
+        cursor = conn.cursor()
+        cursor.execute(SQL_COUNT)
+        return cursor.fetchone()[0]
     
     def get_featured_projects(self) -> List[Dict[str, Any]]:
-        """Get all featured projects."""
-        conn = self.get_connection()
-        try:
-            projects = conn.execute('SELECT * FROM projects WHERE featured = 1 ORDER BY year DESC').fetchall()
-            return [self._row_to_dict(project) for project in projects]
-        finally:
-            conn.close()
+        """Get all featured projects (cached and shared, like get_all_projects)."""
+        return self._get_featured_projects(self._current_version())
     
     def search_projects(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search projects by title or description."""
+        """Search projects by title, description or tech stack.
+        
+        Every word in the search term must match the start of a word in the
+        project, e.g. "flask sql" matches a project using Flask and SQLite.
+        Results are cached and shared, like get_all_projects.
+        """
+        # Quote each word so user input is never parsed as FTS5 syntax
+        words = ['"' + word.replace('"', '""') + '"*' for word in search_term.split()]
+        if not words:
+            return self.get_all_projects()
+        
+        return self._search_projects(self._current_version(), ' '.join(words))
+    
+    @lru_cache(maxsize=8)
+    def _get_featured_projects(self, version: int) -> List[Dict[str, Any]]:
+        """Query featured projects for the given cache version."""
         conn = self.get_connection()
-        try:
-            search_pattern = f'%{search_term}%'
-            projects = conn.execute('''
-                SELECT * FROM projects 
-                WHERE title LIKE ? OR description LIKE ? OR tech_stack LIKE ?
-                ORDER BY featured DESC, year DESC
-            ''', (search_pattern, search_pattern, search_pattern)).fetchall()
-            return [self._row_to_dict(project) for project in projects]
-        finally:
-            conn.close()
+        projects = conn.execute(SQL_GET_FEATURED).fetchall()
+        return self._rows_to_dicts(projects)
+    
+    @lru_cache(maxsize=128)
+    def _search_projects(self, version: int, match_query: str) -> List[Dict[str, Any]]:
+        """Run an FTS5 match query for the given cache version."""
+        conn = self.get_connection()
+        projects = conn.execute(SQL_SEARCH, (match_query,)).fetchall()
+        return self._rows_to_dicts(projects)
 
 
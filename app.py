@@ -1,22 +1,54 @@
-from flask import Flask, send_from_directory, abort, jsonify, request
+from flask import Flask, Response, send_from_directory, abort, jsonify, request
+from flask.json.provider import JSONProvider
+import orjson
 import os
-from DAL import DatabaseAccessLayer
+from DAL import DatabaseAccessLayer, REQUIRED_FIELDS
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify() and request.get_json()."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Base directory (project root)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Initialize Data Access Layer
+# Static asset directories
+CSS_DIR = os.path.join(BASE_DIR, 'css')
+IMAGES_DIR = os.path.join(BASE_DIR, 'images')
+
+# Resume PDF served at /resume.pdf: the first of the known filenames found in
+# resume/ at startup, or None if there is none
+RESUME_DIR = os.path.join(BASE_DIR, 'resume')
+RESUME_PDF = next(
+    (c for c in ('Laufter_Joseph_Resume.pdf', 'resume.pdf') if os.path.isfile(os.path.join(RESUME_DIR, c))),
+    None
+)
+
+# Browser cache lifetime (seconds) for CSS, images and resume files
+STATIC_MAX_AGE = 31536000
+
+# Initialize Data Access Layer and database. This runs at import so the schema
+# also exists when the app is served by a WSGI server such as gunicorn.
 dal = DatabaseAccessLayer()
+dal.init_database()
+# Don't hand this thread's connection to forked worker processes
+dal.close()
 
 
 def _safe_send(filename):
     """Helper to send a file from project root if it exists, otherwise 404."""
-    path = os.path.join(BASE_DIR, filename)
-    if os.path.exists(path) and os.path.isfile(path):
-        return send_from_directory(BASE_DIR, filename)
-    abort(404)
+    # send_from_directory already rejects paths outside BASE_DIR and 404s on
+    # anything that is not a regular file, so no extra stat calls are needed
+    return send_from_directory(BASE_DIR, filename)
 
 
 @app.route('/')
@@ -64,32 +96,39 @@ def root_html(filename):
 # Shortcut for the resume PDF (serve resume/Laufter_Joseph_Resume.pdf as /resume.pdf)
 @app.route('/resume.pdf')
 def resume_pdf():
-    resume_dir = os.path.join(BASE_DIR, 'resume')
-    # Find first pdf in resume dir, or try known filename
-    candidates = ['Laufter_Joseph_Resume.pdf', 'resume.pdf']
-    for c in candidates:
-        p = os.path.join(resume_dir, c)
-        if os.path.exists(p):
-            return send_from_directory(resume_dir, c)
-    # fallback: list files for debug (404)
-    abort(404)
+    if RESUME_PDF is None:
+        abort(404)
+    return send_from_directory(RESUME_DIR, RESUME_PDF, max_age=86400)
 
 
 # Static asset routes
 @app.route('/css/<path:filename>')
 def css(filename):
-    return send_from_directory(os.path.join(BASE_DIR, 'css'), filename)
+    return send_from_directory(CSS_DIR, filename, max_age=STATIC_MAX_AGE)
 
 
 @app.route('/images/<path:filename>')
 def images(filename):
-    return send_from_directory(os.path.join(BASE_DIR, 'images'), filename)
+    return send_from_directory(IMAGES_DIR, filename, max_age=STATIC_MAX_AGE)
 
 
 @app.route('/resume_file/<path:filename>')
 def resume_file(filename):
     # serve files from resume/ folder (PDF)
-    return send_from_directory(os.path.join(BASE_DIR, 'resume'), filename)
+    return send_from_directory(RESUME_DIR, filename, max_age=STATIC_MAX_AGE)
+
+
+@app.after_request
+def add_api_cache_headers(response):
+    """Let clients revalidate API GETs with an ETag instead of re-downloading.
+
+    HTML pages and static files already get an ETag from send_from_directory.
+    """
+    if request.method == 'GET' and response.status_code == 200 and response.mimetype == 'application/json':
+        response.add_etag()
+        response.cache_control.no_cache = True
+        response.make_conditional(request)
+    return response
 
 
 # API Routes for Projects
@@ -97,8 +136,8 @@ def resume_file(filename):
 def get_projects():
     """Get all projects."""
     try:
-        projects = dal.get_all_projects()
-        return jsonify(projects)
+        # Serve the DAL's cached JSON directly rather than re-serializing
+        return Response(dal.get_all_projects_json(), mimetype='application/json')
     except Exception as e:
         return jsonify({'error': 'Failed to fetch projects'}), 500
 
@@ -116,11 +155,12 @@ def get_project(project_id):
 @app.route('/api/projects', methods=['POST'])
 def create_project():
     """Create a new project."""
+    if request.mimetype != 'application/json':
+        return jsonify({'error': 'Content-Type must be application/json'}), 415
     try:
-        data = request.get_json()
+        data = request.get_json(force=True, cache=False)
         
-        required_fields = ['title', 'description', 'image_path', 'project_type', 'year', 'status', 'tech_stack']
-        for field in required_fields:
+        for field in REQUIRED_FIELDS:
             if field not in data:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
         
@@ -132,8 +172,10 @@ def create_project():
 @app.route('/api/projects/<int:project_id>', methods=['PUT'])
 def update_project(project_id):
     """Update an existing project."""
+    if request.mimetype != 'application/json':
+        return jsonify({'error': 'Content-Type must be application/json'}), 415
     try:
-        data = request.get_json()
+        data = request.get_json(force=True, cache=False)
         
         success = dal.update_project(project_id, data)
         if not success:
@@ -157,7 +199,7 @@ def delete_project(project_id):
 
 
 if __name__ == '__main__':
-    # Initialize database on startup
-    dal.init_database()
+    # Development server only; production runs under gunicorn (see Dockerfile).
+    # Set FLASK_DEBUG=1 to enable the debugger and reloader.
     # Run on 0.0.0.0:8000 so it's accessible on the local network
-    app.run(host='0.0.0.0', port=8000, debug=True)
+    app.run(host='0.0.0.0', port=8000, debug=os.environ.get('FLASK_DEBUG') == '1')